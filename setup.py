@@ -43,13 +43,12 @@ setup(
         'svgwrite',
         'bibtexparser>=1.1.0',
         'bs4',
-        'selenium',
-        'svgwrite',
-        'matplotlib',
-        'pandas',
-        'seaborn',
-        'numpy',
     ],
+    extras_require={
+        'selenium': ['selenium'],
+        'plot': ['matplotlib', 'pandas', 'seaborn', 'numpy'],
+        'all': ['selenium', 'matplotlib', 'pandas', 'seaborn', 'numpy'],
+    },
     classifiers=[
         'Development Status :: 3 - Alpha',
 
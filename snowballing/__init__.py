@@ -1,16 +1,16 @@
 """ Snowballing tools """
 import argparse
 import os
+import shutil
 import sys
-import subprocess
 
 from os.path import join, dirname, exists
 from pathlib import Path
-from pkg_resources import resource_string, resource_listdir, resource_isdir
 
 
 def resource(filename, encoding=None):
     """Access resource content via setuptools"""
+    from pkg_resources import resource_string
     content = resource_string(__name__, filename)
     if encoding:
         return content.decode(encoding=encoding)
@@ -19,13 +19,28 @@ def resource(filename, encoding=None):
 
 def recursive_copy(origin, destiny):
     """Copy directory from resource to destiny folder"""
+    try:
+        from importlib.resources import files, as_file
+    except ImportError:
+        # Python < 3.9
+        return _resource_copy(origin, destiny)
+    with as_file(files(__name__).joinpath(origin)) as path:
+        if path.is_dir():
+            shutil.copytree(str(path), destiny, dirs_exist_ok=True)
+        else:
+            shutil.copyfile(str(path), destiny)
+
+
+def _resource_copy(origin, destiny):
+    """Copy directory from resource to destiny folder via setuptools"""
+    from pkg_resources import resource_listdir, resource_isdir
     if resource_isdir(__name__, origin):
         if not exists(destiny):
             os.makedirs(destiny)
         for element in resource_listdir(__name__, origin):
             origin_element = join(origin, element)
             destiny_element = join(destiny, element)
-            recursive_copy(origin_element, destiny_element)
+            _resource_copy(origin_element, destiny_element)
     else:
         with open(destiny, "wb") as fil:
             fil.write(resource(origin))
@@ -53,11 +68,19 @@ def search(args):
         sys.path.append(os.getcwd())
 
         import database
-        from .operations import load_work, work_to_bibtex, reload, find
+        from .collection_helpers import oget
+        from .operations import reload, find, work_to_bibtex_cached, load_work
+        from .operations import load_bibtex_cache, save_bibtex_cache
         reload()
-        results = {x for x in find(args.query)}
-        for work in results:
-            print(work_to_bibtex(work))
+        results = list(dict.fromkeys(find(args.query)))
+        cache = load_bibtex_cache()
+        previous = dict(cache)
+        output = [work_to_bibtex_cached(work, cache) for work in results]
+        if output:
+            sys.stdout.write("\n".join(output) + "\n")
+            sys.stdout.flush()
+        if any(cache[key] is not previous.get(key) for key in cache):
+            save_bibtex_cache(cache, {oget(work, "metakey") for work in load_work()})
 
     except ImportError:
         print("You must execute this command inside the project folder!")
@@ -66,6 +89,7 @@ def search(args):
 
 def web(args):
     """ Start web server """
+    import subprocess
     try:
         sys.path.append(os.getcwd())
         import database
@@ -71,11 +71,13 @@ class Group:
             ddel(kwargs, "approach_dont_cite")
         oset(self, "approach_work", work)
 
+        self.__dict__.update(kwargs)
+        force_prefix = config.APPROACH_FORCE_PREFIX
         for key, item in kwargs.items():
+            force_key = force_prefix + key
             for arg in work:
-                if not hasattr(arg, config.APPROACH_FORCE_PREFIX + key):
+                if not hasattr(arg, force_key):
                     setattr(arg, key, item)
-            setattr(self, key, item)
 
         if self._category == config.APPROACH_RELATED_CATEGORY:
             APPROACHES.append(self)
@@ -114,12 +116,26 @@ class GroupUnrelated(Group):
 
 
 class Item:
-    """Constant Item that supports additional descriptions"""
+    """Constant Item that supports additional descriptions
+
+    Doctest:
+
+    .. doctest::
+
+        >>> python = Item("Python")
+        >>> python == "Python" and python == Item("Python").star("Py")
+        True
+        >>> {python: 1}["Python"]
+        1
+    """
+    __slots__ = ("value", "_star", "_bool", "_examples", "_hash")
+
     def __init__(self, value, _star=None, _bool=True, _examples=[]):
         self.value = value
         self._star = _star
         self._bool = _bool
         self._examples = _examples
+        self._hash = None
 
     def star(self, text):
         """Add description to constant"""
@@ -135,7 +151,9 @@ class Item:
         return self.value == other
 
     def __hash__(self):
-        return hash(self.value)
+        if self._hash is None:
+            self._hash = hash(self.value)
+        return self._hash
 
     def __bool__(self):
         return self._bool
@@ -175,6 +193,8 @@ def name(approach):
 def get_approaches(condition=None):
     """Return pairs of approaches and meta dicts
 
+    The database is only reloaded if it has changed on disk
+
     Doctest:
 
     .. doctest::
@@ -183,20 +203,19 @@ def get_approaches(condition=None):
         >>> reload()
         >>> len(get_approaches())
         1
+        >>> get_approaches(lambda approach, meta: False)
+        []
     """
     if not condition:
         condition = lambda approach, meta: True
-    reload()
-
-    all_approaches = [
+    reload(lazy=True)
+    return [
         (approach, meta)
         for approach in APPROACHES
         for meta in approach._meta
         if condition(approach, meta)
     ]
 
-    return all_approaches
-
 
 def wcite(approach, works, extra=""):
     """Return a latex cite command with all work in an approach"""
@@ -1,21 +1,18 @@
 import os
 import textwrap
 from pathlib import Path
-from string import ascii_lowercase
-from copy import copy
 
-from selenium import webdriver
-from IPython.display import HTML
 from bibtexparser.customization import homogenize_latex_encoding
 
 from snowballing import config
 from snowballing.collection_helpers import define_cvar, setitem, consume
 from snowballing.collection_helpers import callable_get, remove_empty
 from snowballing.config_helpers import set_config, work_by_varname
-from snowballing.config_helpers import last_name_first_author, Site
+from snowballing.config_helpers import free_varname
+from snowballing.config_helpers import last_name_first_author, remove_braces, Site
 from snowballing.config_helpers import find_work_by_info, str_item
 from snowballing.config_helpers import generate_title
-from snowballing.utils import match_any, compare_str
+from snowballing.utils import compile_any, similar_str
 from snowballing.rules import ModifyRules
 
 ## Tool version
@@ -33,8 +30,12 @@ config.LINE_PARAMS = "--goto {year_path}:{line}"  # VSCode
 #config.LINE_PARAMS = "{year_path}:{line}"  # Sublime Text
 
 ## Web Driver
-config.WEB_DRIVER = lambda: webdriver.Chrome()
-#config.WEB_DRIVER = lambda: webdriver.Firefox()
+def web_driver():
+    from selenium import webdriver
+    return webdriver.Chrome()
+    #return webdriver.Firefox()
+
+config.WEB_DRIVER = web_driver
 
 ## Run widget
 ## Use True to indicate that widgets that generate executable code should have a text area with a button for running the code.
@@ -158,7 +159,7 @@ config.BIBTEX_TO_INFO = {
         ("_pyref", lambda old, new: info_to_pyref(old)),
     ],
     "<after>": [
-        ("title", lambda old, new, current: new["title"].replace("{", "").replace("}", ""))
+        ("title", lambda old, new, current: remove_braces(new["title"]))
     ],
     "year": [
         ("_note", lambda x: "in press" if "[in press]" in x.get("year", "") else None)
@@ -230,8 +231,8 @@ config.INFO_TO_INSERT = {
     ],
     "<middle>": [
         ("other", lambda old, new, current: [
-            "{}={!r},".format(key, consume(current, key)) # .replace('"', r'\"')
-            for key in copy(current)
+            "{}={!r},".format(key, current.pop(key)) # .replace('"', r'\"')
+            for key in list(current)
         ]),
         ("attributes", lambda old, new: "\n            ".join(remove_empty([
             new["_due"], new["author"],
@@ -276,10 +277,10 @@ config.FIND_INFO_WORK = {
 #   The result do not need these attributes
 def _work_to_bibtex_middle(work, new, current):
     if config.DEBUG_FIELDS:
-        use = callable_get(config.WORK_TO_BIBTEX, "<use>", [])
-        ignore = callable_get(config.WORK_TO_BIBTEX, "<ignore>", [])
-        for key in dir(work):
-            if not match_any(key, use) and not match_any(key, ignore):
+        use = compile_any(callable_get(config.WORK_TO_BIBTEX, "<use>", []))
+        ignore = compile_any(callable_get(config.WORK_TO_BIBTEX, "<ignore>", []))
+        for key in work.__dict__:
+            if not use.match(key) and not ignore.match(key):
                 print("[DEBUG WARNING]", work._metakey, work.year, key)
 
 config.WORK_TO_BIBTEX = {
@@ -312,50 +313,45 @@ def convert_citation_text_lines_to_info(text):
     """Convert lines of format [N] author name place other year' to Info object
     If it is an invalid format, it should return "Incomplete".
     """
-    lines = text.strip().split("\n")
+    lines = [line.strip() for line in text.strip().split("\n")]
+    last = lines[-1]
     info = {
-        "_citation_id": lines[0].strip(),
+        "_citation_id": lines[0],
     }
-    found = False
-    other = []
 
-    if lines[-1].strip().startswith(">") and len(lines) >= 2:
+    if last.startswith(">") and len(lines) >= 2:
         # [N] > varname
-        info["_pyref"] = lines[-1][1:].strip()
+        info["_pyref"] = last[1:].strip()
         info["_work_type"] = "Ref"
-        found = True
         other = lines[1:-1]
-    elif lines[-1].strip().startswith("http") and len(lines) >= 3:
+    elif last.startswith("http") and len(lines) >= 3:
         # [N] WebName http://...
-        info["title"] = lines[1].strip()
-        info["url"] = lines[-1].strip()
+        info["title"] = lines[1]
+        info["url"] = last
         info["_work_type"] = "Site"
-        found = True
         other = lines[2:-1]
-    elif len(lines) >= 5 and lines[-1].strip().isnumeric():
+    elif len(lines) >= 5 and last.isnumeric():
         # [N] author name place other year
-        info["author"] = lines[1].strip()
-        info["title"] = lines[2].strip()
-        split = lines[3].strip().split("=")
-        if len(split) > 1:
-            info[split[0]] = "=".join(split[1:])
+        info["author"] = lines[1]
+        info["title"] = lines[2]
+        key, equal, value = lines[3].partition("=")
+        if equal:
+            info[key] = value
         else:
-            info["booktitle"] = lines[3].strip()
-        info["year"] = int(lines[-1].strip())
+            info["booktitle"] = lines[3]
+        info["year"] = int(last)
         info["_work_type"] = "Work"
-        found = True
         other = lines[4:-1]
-    if found:
-        for num, line in zip(range(1, 10000), other):
-            line = line.strip()
-            split = line.split("=")
-            if len(split) > 1:
-                info[split[0]] = "=".join(split[1:])
-            else:
-                info["_other{}".format(num)] = line
-        return info
-    
-    return "Incomplete"
+    else:
+        return "Incomplete"
+
+    for num, line in enumerate(other, 1):
+        key, equal, value = line.partition("=")
+        if equal:
+            info[key] = value
+        else:
+            info["_other{}".format(num)] = line
+    return info
 
 
 @set_config("user")
@@ -365,12 +361,7 @@ def info_to_pyref(info):
         display = info["_prefix"]
     else:
         display = last_name_first_author(info["author"])
-    pyref = "{display}{year}".format(display=display, year=info["year"])
-    for letter in ascii_lowercase:
-        if not work_by_varname(pyref + letter):
-            break
-    pyref += letter
-    return pyref
+    return free_varname("{display}{year}".format(display=display, year=info["year"]))
 
 
 @set_config("user")
@@ -526,6 +517,7 @@ def check_load(work, varname, warning=lambda x: print(x)):
 @set_config("user")
 def display_article(article):
     """Display article in widget"""
+    from IPython.display import HTML
     if "_div" in article:
         return [
             HTML("""
@@ -614,7 +606,7 @@ def info_work_match(info, work):
 
     # ToDo: compare other fields and reduce required
     
-    if compare_str(getattr(work, "title"), info.get("title")) > required:
+    if similar_str(getattr(work, "title"), info.get("title"), required):
         return True
 
     return False
@@ -652,6 +644,16 @@ def get_alias_year(work, alias):
 
 ### Graph Attributes
 
+PLACE_FIELDS = ("booktitle", "journal", "school", "howpublished")
+
+def _place_field(work):
+    """Get the first place field defined in work, as a (key, value) pair"""
+    for key in PLACE_FIELDS:
+        value = getattr(work, key, None)
+        if value is not None:
+            return key, value
+    return None, None
+
 ## Get place name from work. fn(work) 
 @set_config("user")
 def graph_place_text(work):
@@ -659,10 +661,7 @@ def graph_place_text(work):
     
     Default: return place acronym
     """
-    for key in ["booktitle", "journal", "school", "howpublished"]:
-        value = getattr(work, key, None)
-        if value is not None:
-            return value
+    return _place_field(work)[1]
 
 ## Generate tooltip for place from work. fn(work)
 @set_config("user")
@@ -671,11 +670,8 @@ def graph_place_tooltip(work):
 
     Default: tooltip with all information from Place object
     """
-    for key in ["booktitle", "journal", "school", "howpublished"]:
-        value = getattr(work, key, None)
-        if value is not None:
-            return key 
-    
+    return _place_field(work)[0]
+
 
 ## Get work link. fn(work)
 @set_config("user")
@@ -688,7 +684,7 @@ def work_link(work):
     for link_type in work._link:
         if link_type == "file" and work._file:
             return "files/" + work._file
-        if link_type == "link" and hasattr(work, "_url") and work._url:
+        if link_type == "link" and getattr(work, "_url", None):
             return work._url
         if link_type == "scholar" and hasattr(work, "_scholar"):
             return work._scholar
@@ -726,8 +722,11 @@ config.APPROACH_RELATED_CATEGORY = "Related"
 @set_config("user")
 def approach_ids_from_work(approach, works):
     for work in approach._work:
-        if work in works and ("snowball" in work._category or "ok" in work._category):
-            yield works[work]["ID"]
+        category = work._category
+        if "snowball" in category or "ok" in category:
+            entry = works.get(work)
+            if entry is not None:
+                yield entry["ID"]
 
 ## Get approach display. fn(approach)
 @set_config("user")
@@ -739,10 +738,12 @@ def approach_display(approach):
 ## Module setting. Do not change it
 from . import work, citations, groups
 
-#config.MODULES["places"] = places
-config.MODULES["work"] = work
-config.MODULES["citations"] = citations
-config.MODULES["groups"] = groups
+config.MODULES.update({
+    #"places": places,
+    "work": work,
+    "citations": citations,
+    "groups": groups,
+})
 
 ## Map of Work attributes used by the tool
 import snowballing.models
@@ -1,46 +1,41 @@
 import functools
 
 
-class VarAccessor(object):
-    """Define functions for accessing atributtes and items using a variable as a map"""
+# Functions for accessing atributtes and items using a variable as a map
+#   The map is defined by define_cvar and can be replaced by the cvar argument
+CVAR = None
 
-    def __init__(self):
-        self.cvar = None
-    
-    def dget(self, collection, key, default=None, cvar=None):
-        return collection.get((cvar or self.cvar)[key], default)
 
-    def dset(self, collection, key, value, cvar=None):
-        collection[(cvar or self.cvar)[key]] = value
+def dget(collection, key, default=None, cvar=None):
+    return collection.get((CVAR if cvar is None else cvar)[key], default)
 
-    def dhas(self, collection, key, cvar=None):
-        return (cvar or self.cvar)[key] in collection
 
-    def ddel(self, collection, key, cvar=None):
-        del collection[(cvar or self.cvar)[key]]
+def dset(collection, key, value, cvar=None):
+    collection[(CVAR if cvar is None else cvar)[key]] = value
 
-    def oget(self, obj, key, default=None, cvar=None):
-        return getattr(obj, (cvar or self.cvar)[key], default)
 
-    def oset(self, obj, key, value, cvar=None):
-        setattr(obj, (cvar or self.cvar)[key], value)
+def dhas(collection, key, cvar=None):
+    return (CVAR if cvar is None else cvar)[key] in collection
 
-    def ohas(self, obj, key, cvar=None):
-        return hasattr(obj, (cvar or self.cvar)[key])
 
-    def odel(self, obj, key, cvar=None):
-        del obj[(cvar or self.cvar)[key]]
-    
+def ddel(collection, key, cvar=None):
+    del collection[(CVAR if cvar is None else cvar)[key]]
 
-var_accessor = VarAccessor()
-dget = var_accessor.dget
-dset = var_accessor.dset
-dhas = var_accessor.dhas
-ddel =var_accessor.ddel
-oget = var_accessor.oget
-oset = var_accessor.oset
-ohas = var_accessor.ohas
-odel = var_accessor.odel
+
+def oget(obj, key, default=None, cvar=None):
+    return getattr(obj, (CVAR if cvar is None else cvar)[key], default)
+
+
+def oset(obj, key, value, cvar=None):
+    setattr(obj, (CVAR if cvar is None else cvar)[key], value)
+
+
+def ohas(obj, key, cvar=None):
+    return hasattr(obj, (CVAR if cvar is None else cvar)[key])
+
+
+def odel(obj, key, cvar=None):
+    del obj[(CVAR if cvar is None else cvar)[key]]
 
 
 def consume(info, key):
@@ -63,11 +58,7 @@ def consume(info, key):
         >>> consume(info, 'abc') is None
         True
     """
-    if key not in info:
-        return None
-    result = info[key]
-    del info[key]
-    return result
+    return info.pop(key, None)
 
 
 def consume_key(collection, key, use_key):
@@ -99,8 +90,20 @@ def setitem(info, key, value):
         info[key] = value
 
 
-def callable_get(collection, key, default=None, args=[]):
-    """Get item from collection. Return collection applied to args, if it is callable"""
+def callable_get(collection, key, default=None, args=()):
+    """Get item from collection. Return collection applied to args, if it is callable
+
+    Doctest:
+
+    .. doctest::
+
+        >>> callable_get({'a': 1, 'b': lambda: 2}, 'a')
+        1
+        >>> callable_get({'a': 1, 'b': lambda: 2}, 'b')
+        2
+        >>> callable_get({'c': lambda x: x + 1}, 'c', args=(2,))
+        3
+    """
     result = collection.get(key, default)
     if callable(result):
         return result(*args)
@@ -108,11 +111,18 @@ def callable_get(collection, key, default=None, args=[]):
 
 
 def remove_empty(elements):
-    """Remove empty elements from list"""
-    for element in elements:
-        if element:
-            yield element
+    """Remove empty elements from list
+
+    Doctest:
+
+    .. doctest::
+
+        >>> list(remove_empty(["a", "", None, "b", []]))
+        ['a', 'b']
+    """
+    return filter(None, elements)
 
 
 def define_cvar(cvar):
-    var_accessor.cvar = cvar
+    global CVAR
+    CVAR = cvar
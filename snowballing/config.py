@@ -3,22 +3,20 @@
 Please, use the database __init__ to replace these configurations.
 """
 import textwrap
-from copy import copy
 from pathlib import Path
 
-from string import ascii_lowercase
 from bibtexparser.customization import homogenize_latex_encoding
-from IPython.display import HTML
-from selenium import webdriver
 
 from .collection_helpers import callable_get, define_cvar
 from .collection_helpers import consume, setitem, remove_empty
-from .config_helpers import reorder_place, last_name_first_author
+from .config_helpers import reorder_place, last_name_first_author, remove_braces
 from .config_helpers import var_item, str_list, str_item, sequence
 from .config_helpers import work_by_varname, find_work_by_info, Site
+from .config_helpers import free_varname
 from .config_helpers import generate_title
 from .rules import ModifyRules
-from .utils import compare_str, match_any, to_list
+from .utils import compare_str_at_least, compile_any
+from .utils import similar_str, to_list
 
 # Tool version
 JOHN_SNOW_VERSION = "1.0.0"
@@ -33,7 +31,9 @@ TEXT_EDITOR = None
 LINE_PARAMS = None
 
 # Web Driver
-WEB_DRIVER = lambda: webdriver.Chrome()
+def WEB_DRIVER():
+    from selenium import webdriver
+    return webdriver.Chrome()
 
 # Run widget
 # Use True to indicate that widgets that generate executable code should have a text area with a button for running the code.
@@ -109,6 +109,9 @@ def _place_value(place1):
 
     It also considers a match if the acronym matches.
 
+    Results are memoized in operations.PLACE_CACHE, which is cleared
+    when the database reloads.
+
     Doctest:
 
     .. doctest::
@@ -121,18 +124,25 @@ def _place_value(place1):
         >>> _place_value("A random conference") is None
         True
     """
-    from .operations import load_places_vars
+    from .operations import load_places_vars, place_by_exact_name, PLACE_CACHE
+    if place1 in PLACE_CACHE:
+        return PLACE_CACHE[place1]
     place = reorder_place(place1)
+    result = place_by_exact_name(place)
+    if result is not None:
+        PLACE_CACHE[place1] = result
+        return result
 
-    maxmatch = max(
-        (max(
-            compare_str(place, varvalue.name),
-            1 if place == varvalue.acronym else 0
-        ), varname, varvalue) for varname, varvalue in load_places_vars()
-    )
+    maxmatch = (-1, None, None)
+    for varname, varvalue in load_places_vars():
+        ratio = compare_str_at_least(place, varvalue.name, maxmatch[0])
+        maxmatch = max(maxmatch, (ratio, varname, varvalue))
 
+    result = None
     if maxmatch[0] >= SIMILARITY_RATIO or maxmatch[2].name in place:
-        return maxmatch[1]
+        result = maxmatch[1]
+    PLACE_CACHE[place1] = result
+    return result
     
 def _pos_diff(work, info, result):
     """Remove from diff if result in list or alias"""
@@ -194,7 +204,7 @@ BIBTEX_TO_INFO = {
         ("pyref", lambda old, new: info_to_pyref(new)),
     ],
     "<after>": [
-        ("name", lambda old, new, current: new["name"].replace("{", "").replace("}", ""))
+        ("name", lambda old, new, current: remove_braces(new["name"]))
     ],
     "title": ["name"],
     "author": ["authors"],
@@ -305,8 +315,8 @@ INFO_TO_INSERT = {
             str_item("place1", obj="new"), 
         ])),
         ("other", lambda old, new, current: [
-            "{}={!r},".format(key, consume(current, key)) # .replace('"', r'\"')
-            for key in copy(current)
+            "{}={!r},".format(key, current.pop(key)) # .replace('"', r'\"')
+            for key in list(current)
         ]),
         ("attributes", lambda old, new: "\n            ".join(remove_empty([
             new["due"], new["related"], new["display"],
@@ -333,6 +343,15 @@ INFO_TO_INSERT = {
 }
 
 
+# Place of info objects without place, according to the entry type
+ENTRYTYPE_PLACE = {
+    "phdthesis": "Thesis",
+    "mastersthesis": "Thesis",
+    "techreport": "TechReport",
+    "book": "Book",
+}
+
+
 # Modify Info object for finding work
 #   <skip> and <ignore> only exist for this
 FIND_INFO_WORK = {
@@ -341,13 +360,7 @@ FIND_INFO_WORK = {
     ],
     "<ignore>": ["_year", "_work", "_key"],
     "<before>": [
-        ("place", lambda old: 
-            None if "entrytype" not in old else
-            "Thesis" if old["entrytype"] in ("phdthesis", "mastersthesis") else
-            "TechReport" if old["entrytype"] == "techreport" else
-            "Book" if old["entrytype"] == "book" else
-            None
-        ), 
+        ("place", lambda old: ENTRYTYPE_PLACE.get(old.get("entrytype"))),
         ("_work", lambda old: work_by_varname(old["ID"]) if "ID" in old else None),
         ("_key", lambda old: old["ID"] if "ID" in old else None),
     ],
@@ -356,6 +369,20 @@ FIND_INFO_WORK = {
 }
 
 
+# BibTeX field that receives the work place, according to the entry type
+BIBTEX_PLACE_KEY = {
+    "incollection": "booktitle",
+    "inproceedings": "booktitle",
+    "misc": "booktitle",
+    "article": "journal",
+    "book": None,
+    "mastersthesis": None,
+    "phdthesis": None,
+    "techreport": None,
+    "": None
+}
+
+
 # Convert Work into BibTex dict
 #   The "new" object starts with three parameters
 #     _name: override metakey name
@@ -364,22 +391,12 @@ FIND_INFO_WORK = {
 #   The result do not need these attributes
 def _work_to_bibtex_middle(work, new, current):
     if DEBUG_FIELDS:
-        use = callable_get(WORK_TO_BIBTEX, "<use>", [])
-        ignore = callable_get(WORK_TO_BIBTEX, "<ignore>", [])
-        for key in dir(work):
-            if not match_any(key, use) and not match_any(key, ignore):
+        use = compile_any(callable_get(WORK_TO_BIBTEX, "<use>", []))
+        ignore = compile_any(callable_get(WORK_TO_BIBTEX, "<ignore>", []))
+        for key in work.__dict__:
+            if not use.match(key) and not ignore.match(key):
                 print("[DEBUG WARNING]", work.display, work.year, key)
-    new_place_key = {
-        "incollection": "booktitle",
-        "inproceedings": "booktitle",
-        "misc": "booktitle",
-        "article": "journal",
-        "book": None,
-        "mastersthesis": None,
-        "phdthesis": None,
-        "techreport": None,
-        "": None
-    }[new.get("ENTRYTYPE", "")]
+    new_place_key = BIBTEX_PLACE_KEY[new.get("ENTRYTYPE", "")]
     if new_place_key and hasattr(work, "place"):
         conference_has_acronym = (
             new["_acronym"]
@@ -434,48 +451,57 @@ def convert_citation_text_lines_to_info(text):
       - Work: [N] author name place other year
         - 'other' can be either lines with values, or use the format key=value
 
+    Doctest:
+
+    .. doctest::
+
+        >>> info = convert_citation_text_lines_to_info(
+        ...     "[1]\\nMurta, L.\\nnoWorkflow\\nIPAW\\npp=71--83\\nnote\\n2014"
+        ... )
+        >>> sorted(info.items())  # doctest: +NORMALIZE_WHITESPACE
+        [('_work_type', 'Work'), ('authors', 'Murta, L.'), ('citation_id', '[1]'),
+         ('name', 'noWorkflow'), ('other2', 'note'), ('place1', 'IPAW'),
+         ('pp', '71--83'), ('year', 2014)]
+        >>> convert_citation_text_lines_to_info("[1]\\n> murta2014a")["pyref"]
+        'murta2014a'
+        >>> convert_citation_text_lines_to_info("[1]\\nMurta")
+        'Incomplete'
     """
-    lines = text.strip().split("\n")
+    lines = [line.strip() for line in text.strip().split("\n")]
+    last = lines[-1]
     info = {
-        "citation_id": lines[0].strip(),
+        "citation_id": lines[0],
     }
-    found = False
-    other = []
 
-    if lines[-1].strip().startswith(">") and len(lines) >= 2:
+    if last.startswith(">") and len(lines) >= 2:
         # [N] > varname
-        info["pyref"] = lines[-1][1:].strip()
+        info["pyref"] = last[1:].strip()
         info["_work_type"] = "Ref"
-        found = True
         other = lines[1:-1]
-    elif lines[-1].strip().startswith("http") and len(lines) >= 3:
+    elif last.startswith("http") and len(lines) >= 3:
         # [N] WebName http://...
-        info["name"] = lines[1].strip()
-        info["url"] = lines[-1].strip()
+        info["name"] = lines[1]
+        info["url"] = last
         info["_work_type"] = "Site"
-        found = True
         other = lines[2:-1]
-    elif len(lines) >= 5 and lines[-1].strip().isnumeric():
+    elif len(lines) >= 5 and last.isnumeric():
         # [N] author name place other year
-        info["authors"] = lines[1].strip()
-        info["name"] = lines[2].strip()
-        info["place1"] = lines[3].strip()
-        info["year"] = int(lines[-1].strip())
+        info["authors"] = lines[1]
+        info["name"] = lines[2]
+        info["place1"] = lines[3]
+        info["year"] = int(last)
         info["_work_type"] = "Work"
-        found = True
         other = lines[4:-1]
+    else:
+        return "Incomplete"
 
-    if found:
-        for num, line in zip(range(1, 10000), other):
-            line = line.strip()
-            split = line.split("=")
-            if len(split) > 1:
-                info[split[0]] = "=".join(split[1:])
-            else:
-                info["other{}".format(num)] = line
-        return info
-    
-    return "Incomplete"
+    for num, line in enumerate(other, 1):
+        key, equal, value = line.partition("=")
+        if equal:
+            info[key] = value
+        else:
+            info["other{}".format(num)] = line
+    return info
 
 
 def info_to_pyref(info):
@@ -489,12 +515,7 @@ def info_to_pyref(info):
         >>> info_to_pyref({'display': 'pimentel', 'year': 2015})
         'pimentel2015b'
     """
-    pyref = "{display}{year}".format(**info)
-    for letter in ascii_lowercase:
-        if not work_by_varname(pyref + letter):
-            break
-    pyref += letter
-    return pyref
+    return free_varname("{display}{year}".format(**info))
 
 
 def set_info_letter(info, letter):
@@ -671,6 +692,7 @@ def check_load(work, varname, warning=lambda x: print(x)):
 
 def display_article(article):
     """Display article in widget"""
+    from IPython.display import HTML
     if "div" in article:
         return [
             HTML("""
@@ -774,7 +796,7 @@ def info_work_match(info, work):
     if same_place:
         required -= 0.1
     
-    if compare_str(str(getattr(work, "name")), info.get("name")) > required:
+    if similar_str(str(getattr(work, "name")), info.get("name"), required):
         return True
 
     return False
@@ -836,7 +858,7 @@ def work_link(work):
     for link_type in work._link:
         if link_type == "file" and work.file:
             return "files/" + work.file
-        if link_type == "link" and hasattr(work, "link") and work.link:
+        if link_type == "link" and getattr(work, "link", None):
             return work.link
         if link_type == "scholar" and hasattr(work, "scholar"):
             return work.scholar
@@ -870,8 +892,11 @@ APPROACH_RELATED_CATEGORY = "Related"
 
 def approach_ids_from_work(approach, works):
     for work in approach.work:
-        if work in works and ("snowball" in work.category or "ok" in work.category):
-            yield works[work]["ID"]
+        category = work.category
+        if "snowball" in category or "ok" in category:
+            entry = works.get(work)
+            if entry is not None:
+                yield entry["ID"]
 
 def approach_display(approach):
     """Get approach display"""
@@ -5,7 +5,17 @@ import re
 from string import ascii_lowercase
 
 from .collection_helpers import consume_key, oset, odel, ohas, dset
-from .utils import compare_str, match_any
+from .utils import compare_str, compile_any
+
+
+AUTHOR_LAST_NAME = re.compile(r'(\w*)[`\-=~!@#$%^&*()_+\[\]{};\'\\:"|<,/<>?]')
+ORDINAL_SUFFIX = re.compile(r"(?<=[0-9])(?:st|nd|rd|th)")
+PLACE_PREFIXES = [
+    re.compile(r"(.*) (International Conference on)", re.I),
+    re.compile(r"(.*) (International Convention on)", re.I),
+    re.compile(r"(.*) (International Symposium on)", re.I),
+]
+BRACES = str.maketrans("", "", "{}")
 
 
 def last_name_first_author(authors):
@@ -32,7 +42,7 @@ def last_name_first_author(authors):
     if "," not in authors:
         last = authors.split()[-1]
     else:
-        last = re.findall(r'(\w*)[`\-=~!@#$%^&*()_+\[\]{};\'\\:"|<,/<>?]', authors)[0]
+        last = AUTHOR_LAST_NAME.findall(authors)[0]
     return last.lower()
 
 
@@ -46,15 +56,35 @@ def reorder_place(place):
     * International Convention on
     * International Symposium on
 
+    Doctest:
+
+    .. doctest::
+
+        >>> reorder_place("Proceedings of the ACM International Conference on Management of Data")
+        'International Conference on ACM Management of Data'
+        >>> reorder_place("Symposium on Software Engineering 2nd")
+        'Symposium on Software Engineering '
     """
     place = place.replace("Proceedings of the ", "")
-    place = re.sub(r"(?<=[0-9])(?:st|nd|rd|th)", "", place)
-    place = re.sub(r"(.*) (International Conference on)", r"\2 \1", place, flags=re.I)
-    place = re.sub(r"(.*) (International Convention on)", r"\2 \1", place, flags=re.I)
-    place = re.sub(r"(.*) (International Symposium on)", r"\2 \1", place, flags=re.I)
+    place = ORDINAL_SUFFIX.sub("", place)
+    for prefix in PLACE_PREFIXES:
+        place = prefix.sub(r"\2 \1", place)
     return "".join([i for i in place if not i.isdigit()])
 
 
+def remove_braces(text):
+    """Remove BibTeX braces from text
+
+    Doctest:
+
+    .. doctest::
+
+        >>> remove_braces("{noWorkflow}: capturing and analyzing provenance of {S}cripts")
+        'noWorkflow: capturing and analyzing provenance of Scripts'
+    """
+    return text.translate(BRACES)
+
+
 def select_param(obj, old, new, current):
     return {
         "old": old,
@@ -115,6 +145,11 @@ def work_by_varname(varname):
     return work_by_varname(varname)
 
 
+def free_varname(prefix):
+    from .operations import free_varname
+    return free_varname(prefix)
+
+
 def find_work_by_info(paper, pyrefs=None):
     from .operations import find_work_by_info
     return find_work_by_info(paper, pyrefs=None)
@@ -161,10 +196,11 @@ def generate_title(obj, prepend="\n\n", ignore={"_.*"}):
         >>> print(generate_title(obj, prepend="", ignore={"_.*", "attr"}))
         attr2: y
     """
+    ignore = compile_any(sorted(ignore))
     result = "\n".join(
         "{}: {}".format(attr, str(value))
         for attr, value in obj.__dict__.items()
-        if not match_any(attr, ignore)
+        if not ignore.match(attr)
         if value is not None
     )
     return prepend + result if result else ""
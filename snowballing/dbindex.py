@@ -10,6 +10,13 @@ from string import ascii_letters
 from . import config
 
 
+VARNAME = re.compile(r"(.*)(\d\d\d\d)(.*)")
+NEXT_LETTER = {
+    letter: chr(ord(letter) + 1) if letter != "z" else "a"
+    for letter in ascii_letters
+}
+
+
 def citation_file(name):
     """Return the database file for a specific approach
 
@@ -65,6 +72,20 @@ def places_file():
     return config.DATABASE_DIR / "places.py"
 
 
+def bibtex_cache_file():
+    """Return the file that caches BibTeX exports
+
+    Doctest:
+
+    .. doctest::
+
+        >>> from pathlib import Path
+        >>> [bibtex_cache_file()]  # doctest: +ELLIPSIS
+        [...bibtex_cache.json')]
+    """
+    return config.DATABASE_DIR / "bibtex_cache.json"
+
+
 def this_file(filename):
     """Extract filename without python extension
 
@@ -81,7 +102,7 @@ def this_file(filename):
         >>> this_file(__file__)
         'dbindex'
     """
-    return ".".join(os.path.basename(filename).split(".")[:-1])
+    return os.path.splitext(os.path.basename(filename))[0]
 
 
 def discover_year(varname, year=None, fail_raise=True):
@@ -141,10 +162,10 @@ def increment_char(letter):
         'c'
         >>> increment_char('z')
         'a'
+        >>> increment_char('1')
+        'a'
     """
-    if letter not in ascii_letters:
-        return "a"
-    return chr(ord(letter) + 1) if letter != "z" else "a"
+    return NEXT_LETTER.get(letter, "a")
 
 
 def increment_str(varname):
@@ -168,16 +189,15 @@ def increment_str(varname):
         'murta2014aa'
         >>> increment_str('murta2014az')
         'murta2014ba'
+        >>> increment_str('zz')
+        'aaa'
     """
     lpart = varname.rstrip("z")
     num_replacements = len(varname) - len(lpart)
-    new_s = lpart
-    if lpart and lpart[-1] in ascii_letters:
-        new_s = lpart[:-1] + increment_char(lpart[-1])
-    else:
-        new_s += "a"
-    new_s += "a" * num_replacements
-    return new_s
+    last = lpart[-1:]
+    if last in NEXT_LETTER:
+        return lpart[:-1] + NEXT_LETTER[last] + "a" * num_replacements
+    return lpart + "a" * (num_replacements + 1)
 
 
 def parse_varname(varname, group_index):
@@ -218,8 +238,7 @@ def parse_varname(varname, group_index):
         >>> parse_varname(varname, 0) is None
         True
     """
-    return getattr(
-        re.search(r"(.*)(\d\d\d\d)(.*)", varname),
-        "group",
-        lambda x: None
-    )(group_index)
+    match = VARNAME.match(varname)
+    if match is None:
+        return None
+    return match.group(group_index)
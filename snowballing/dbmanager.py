@@ -17,13 +17,18 @@ import warnings
 import os
 import re
 
-from collections import defaultdict
+from collections import Counter
 from .operations import reload, work_by_varname, load_citations
 from .dbindex import year_file, citation_file, parse_varname, discover_year
 from .dbindex import increment_str
 from .utils import compare_str
 
 
+IMPORT_YEAR = re.compile(r"work\.y(\d\d\d\d)")
+YEAR = re.compile(r"\d\d\d\d")
+WORD = re.compile(r"\w.*")
+
+
 class ReplaceOperation(object):
     """Operation for replacing `.target` lines by `:value`"""
 
@@ -39,8 +44,7 @@ class ReplaceOperation(object):
             lines[self.first_line][:self.first_col] + value
             + lines[self.last_line][self.last_col:]
         )
-        for line in range(self.last_line, self.first_line, -1):
-            del lines[line]
+        del lines[self.first_line + 1:self.last_line + 1]
 
 
 class DelOperation(object):
@@ -54,9 +58,10 @@ class DelOperation(object):
         replace = ReplaceOperation(self.keyword)
         replace.apply(lines, "")
         if self.delete_lines:
-            del lines[replace.first_line]
-            while replace.first_line < len(lines) and not lines[replace.first_line]:
-                del lines[replace.first_line]
+            end = replace.first_line + 1
+            while end < len(lines) and not lines[end]:
+                end += 1
+            del lines[replace.first_line:end]
 
 
 class AddKeywordOperation(object):
@@ -184,16 +189,17 @@ class EditVisitor(ast.NodeVisitor):
                         self.add_keyword(attribute, last_line)
                 elif self.operation.startswith("del "):
                     attribute = self.operation.split()[1]
-                    lines = defaultdict(set)
+                    lines = Counter()
                     for keyword in node.value.args[0].keywords:
-                        lines[keyword.first_line].add(keyword)
-                        lines[keyword.last_line].add(keyword)
+                        lines[keyword.first_line] += 1
+                        if keyword.last_line != keyword.first_line:
+                            lines[keyword.last_line] += 1
                     for keyword in node.value.args[0].keywords:
                         if keyword.arg == attribute:
                             self.remove_keyword(
                                 keyword,
-                                (len(lines[keyword.first_line]) == 1 and
-                                 len(lines[keyword.last_line]) == 1)
+                                (lines[keyword.first_line] == 1 and
+                                 lines[keyword.last_line] == 1)
                             )
 
 
@@ -279,7 +285,7 @@ class CitationVisitor(ast.NodeVisitor):
         last_line = 0
         for stmt in body:
             if isinstance(stmt, ast.ImportFrom) and stmt.module is not None:
-                year = int(getattr(re.search(r"work\.y(\d\d\d\d)", stmt.module), "group", lambda x: -1)(1))
+                year = int(getattr(IMPORT_YEAR.search(stmt.module), "group", lambda x: -1)(1))
                 if self.year == year and self.operation == "remove import":
                     aliases = [a for a in stmt.names if a.name == self.varname]
                     if aliases:
@@ -289,13 +295,13 @@ class CitationVisitor(ast.NodeVisitor):
                         elif aliases[0] == stmt.names[-1]:
                             line = "".join(reversed(self.lines[aliases[0].last_line - 1]))
                             pos = len(line) - aliases[0].first_col
-                            aliases[0].first_col = len(line) - next(re.compile("\w.*").finditer(line, pos=pos)).span()[0]
+                            aliases[0].first_col = len(line) - WORD.search(line, pos).start()
                             self.result = DelOperation(aliases[0], False)
                             self.old = pyposast.extract_code(self.lines, aliases[0])
                         else:
                             line = self.lines[aliases[0].last_line - 1]
                             pos = aliases[0].last_col
-                            aliases[0].last_col = next(re.compile("\w.*").finditer(line, pos=pos)).span()[0]
+                            aliases[0].last_col = WORD.search(line, pos).start()
                             self.result = DelOperation(aliases[0], False)
                             self.old = pyposast.extract_code(self.lines, aliases[0])
                         break
@@ -374,9 +380,10 @@ def citation_operation(filename, lines, varname, year, operation, value=""):
     """Apply `:operation` for `:varname` in a citation file `:filename`"""
     visitor = CitationVisitor(lines, varname, year, operation)
     if operation == "rename":
-        regex = re.compile(varname + r"\s*?,")
-        for i, line in enumerate(lines):
-            lines[i] = regex.sub(value + ",", line)
+        regex = re.compile(varname + r"[^\S\n]*?,")
+        code, count = regex.subn(value + ",", "\n".join(lines))
+        if count:
+            lines[:] = code.split("\n")
         return visitor, True
     elif operation == "insert citation":
         if lines[-1]:
@@ -426,7 +433,7 @@ def remove_source_citation(name, varname, year=None, dry_run=False):
         visitor, doing = citation_operation(filename, lines, varname, year, "remove source")
         target = visitor.old.split("<=>")[0]
         print("-Remove Citation:", varname, "->", target)
-        tyear = re.search(r"\d\d\d\d", target)
+        tyear = YEAR.search(target)
         if tyear:
             targets.append((target, int(tyear.group(0))))
 
@@ -456,7 +463,7 @@ def remove_target_citation(name, varname, year=None, dry_run=False):
         visitor, doing = citation_operation(filename, lines, varname, year, "remove target")
         source = visitor.old.split("<=>")[0]
         print("-Remove citation:", source, "->", varname)
-        syear = re.search(r"\d\d\d\d", source)
+        syear = YEAR.search(source)
         if syear:
             sources.append((source, int(syear.group(0))))
 
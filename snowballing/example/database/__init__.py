@@ -1,8 +1,6 @@
 import os
 from pathlib import Path
 
-from selenium import webdriver
-
 from snowballing import config
 from snowballing.collection_helpers import define_cvar
 from snowballing.config_helpers import set_config
@@ -24,8 +22,12 @@ config.LINE_PARAMS = "--goto {year_path}:{line}"  # VSCode
 #config.LINE_PARAMS = "{year_path}:{line}"  # Sublime Text
 
 ## Web Driver
-config.WEB_DRIVER = lambda: webdriver.Chrome()
-#config.WEB_DRIVER = lambda: webdriver.Firefox()
+def web_driver():
+    from selenium import webdriver
+    return webdriver.Chrome()
+    #return webdriver.Firefox()
+
+config.WEB_DRIVER = web_driver
 
 ## Run widget
 ## Use True to indicate that widgets that generate executable code should have a text area with a button for running the code.
@@ -320,10 +322,12 @@ config.APPROACH_RELATED_CATEGORY = "Related"
 ## Module setting. Do not change it
 from . import places, work, citations, groups
 
-config.MODULES["places"] = places
-config.MODULES["work"] = work
-config.MODULES["citations"] = citations
-config.MODULES["groups"] = groups
+config.MODULES.update({
+    "places": places,
+    "work": work,
+    "citations": citations,
+    "groups": groups,
+})
 
 ## Map of Work attributes used by the tool
 #config.ATTR = ... 
@@ -270,18 +270,15 @@ class Work(object):
             text.add(svgwrite.text.TSpan(line, (self._x, self._y + y)))
 
 
-        shape.set_desc(title=Title(
-            config.work_tooltip(self)
-        ))
-        text.set_desc(title=Title(
-            config.work_tooltip(self)
-        ))
+        tooltip = config.work_tooltip(self)
+        shape.set_desc(title=Title(tooltip))
+        text.set_desc(title=Title(tooltip))
 
         if draw_place:
             place_text = config.graph_place_text(self)
             if place_text:
                 self._draw_place(
-                    config.graph_place_text(self),
+                    place_text,
                     config.graph_place_tooltip(self),
                     dwg, position - Point(0, self._r + 4)
                 )
@@ -1,7 +1,10 @@
 """This module contains functions to :meth:`~reload` the database, load work and
 citations from there, and operate BibTeX"""
 
+import hashlib
 import importlib
+import json
+import os
 import re
 import textwrap
 import warnings
@@ -9,6 +12,8 @@ import subprocess
 
 from copy import copy
 from collections import OrderedDict
+from pathlib import Path
+from string import ascii_lowercase
 
 from bibtexparser.bwriter import BibTexWriter
 from bibtexparser.bibdatabase import BibDatabase
@@ -17,7 +22,7 @@ from bibtexparser.bibdatabase import BibDatabase
 from .collection_helpers import oget, oset, dget, dset, dhas
 from .collection_helpers import consume, setitem, callable_get
 from .models import DB, Year
-from .dbindex import parse_varname, year_file
+from .dbindex import parse_varname, year_file, bibtex_cache_file
 
 from .utils import import_submodules
 from .utils import parse_bibtex
@@ -28,6 +33,11 @@ from . import config
 WORK_CACHE = {}
 CITATION_CACHE = {}
 GROUP_CACHE = {}
+WORK_LIST_CACHE = {}
+BIBTEX_CACHE = {}
+PLACE_CACHE = {}
+PLACE_INDEX = {}
+DB_SNAPSHOT = {}
 
 
 def load_work():
@@ -58,6 +68,31 @@ def load_places_vars():
             yield varname, varvalue
 
 
+def place_by_exact_name(name):
+    """Return the variable name of the place whose acronym or name is
+    exactly the given name. Return None if there is no such place
+
+    If more than one place matches, it returns the greatest variable name.
+    The index is built once and discarded on :meth:`~reload`
+
+    Doctest:
+
+    .. doctest::
+
+        >>> place_by_exact_name('IPAW')
+        'IPAW'
+        >>> place_by_exact_name('International Conference on Software Engineering')
+        'ICSE'
+        >>> place_by_exact_name('ipaw') is None
+        True
+    """
+    if not PLACE_INDEX:
+        for varname, varvalue in load_places_vars():
+            for key in (varvalue.acronym, varvalue.name):
+                PLACE_INDEX[key] = max(PLACE_INDEX.get(key, varname), varname)
+    return PLACE_INDEX.get(name)
+
+
 def load_work_map(year):
     """Load all work from a given year file
     It generates tuples with variable name and Work object
@@ -103,6 +138,31 @@ def work_by_varname(varname, year=None):
     return getattr(worklist, varname, None)
 
 
+def free_varname(prefix):
+    """Return the first varname formed by prefix and a sequential letter that
+    is not used by any work
+
+    The year file is looked up only once for all letters.
+    If all letters are used, it returns the varname with the last letter
+
+    Doctest:
+
+    .. doctest::
+
+        >>> reload()
+        >>> free_varname("pimentel2017")
+        'pimentel2017a'
+        >>> free_varname("pimentel2015")
+        'pimentel2015b'
+    """
+    year = int(parse_varname(prefix + "a", 2) or -1)
+    worklist = WORK_CACHE.get("y{}.py".format(year))
+    for letter in ascii_lowercase:
+        if worklist is None or not getattr(worklist, prefix + letter, None):
+            break
+    return prefix + letter
+
+
 def load_work_map_all_years():
     """Load all work from all years
 
@@ -121,10 +181,41 @@ def load_work_map_all_years():
         yield from load_work_map(year)
 
 
+def load_work_list(year):
+    """Load a list of pairs with variable name and Work object from a given
+    year file, or from all years if year is 0
+
+    The list is cached until the next :meth:`~reload`
+
+    Doctest:
+
+    .. doctest::
+
+        >>> reload()
+        >>> sorted(key for key, work in load_work_list(2015))
+        ['murta2014a', 'pimentel2015a']
+        >>> load_work_list(2015) is load_work_list(2015)
+        True
+        >>> len(load_work_list(0))
+        4
+    """
+    if year not in WORK_LIST_CACHE:
+        if year == 0:
+            WORK_LIST_CACHE[year] = list(load_work_map_all_years())
+        else:
+            WORK_LIST_CACHE[year] = list(load_work_map(year))
+    return WORK_LIST_CACHE[year]
+
+
 def _clear_db():
     """Erase database"""
     from .approaches import APPROACHES
     APPROACHES.clear()
+    WORK_LIST_CACHE.clear()
+    BIBTEX_CACHE.clear()
+    PLACE_CACHE.clear()
+    PLACE_INDEX.clear()
+    DB_SNAPSHOT.clear()
     importlib.invalidate_caches()
     DB.clear_places()
     DB.clear_work()
@@ -143,9 +234,24 @@ def _reload_work():
             )
 
 
-def reload(work_func=None):
+def _database_snapshot():
+    """Return the modification time of each database module"""
+    return {
+        str(path): path.stat().st_mtime
+        for path in Path(config.DATABASE_DIR).rglob("*.py")
+    }
+
+
+def reload(work_func=None, lazy=False):
     """Reload all the database
 
+    Arguments:
+
+    * `work_func` -- function to apply to each work after loading it
+
+    * `lazy` -- skip reloading if no database module changed since the last
+      reload. In-memory modifications are kept
+
     Doctest:
 
     ..doctest::
@@ -157,8 +263,16 @@ def reload(work_func=None):
         >>> from snowballing.example.database.work.y2015 import murta2014a as alias
         >>> alias is murta2014a
         True
+        >>> reload(lazy=True)
+        >>> work_by_varname("murta2014a") is murta2014a
+        True
+        >>> reload()
+        >>> work_by_varname("murta2014a") is murta2014a
+        False
     """
-    
+    snapshot = _database_snapshot()
+    if lazy and work_func is None and DB_SNAPSHOT.get("modules") == snapshot:
+        return
     _clear_db()
     if config.MODULES["places"]:
         importlib.reload(config.MODULES["places"])
@@ -178,6 +292,7 @@ def reload(work_func=None):
             if module not in WORK_CACHE:
                 module = "y9999.py"
             setattr(WORK_CACHE[module], key, work)
+    DB_SNAPSHOT["modules"] = snapshot
 
 
 def bibtex_to_info(citation, rules=None):
@@ -578,10 +693,7 @@ def find_work_by_info(paper, pyrefs=None, rules=None):
     new_paper = convert.run(paper)
     old_paper, paper = paper, new_paper
 
-    worklist = load_work_map(paper["_year"])
-
-    if paper["_year"] == 0:
-        worklist = load_work_map_all_years()
+    worklist = load_work_list(paper["_year"])
 
     if "_work" in paper:
         key = paper["_key"]
@@ -815,6 +927,118 @@ def work_to_bibtex(work, name=None, acronym=False, rules=None):
     return writer.write(db)
 
 
+def work_digest(work):
+    """Summarize all work attributes into a digest string
+
+    Doctest:
+
+    .. doctest::
+
+        >>> reload()
+        >>> murta2014a = work_by_varname("murta2014a")
+        >>> digest = work_digest(murta2014a)
+        >>> digest == work_digest(murta2014a)
+        True
+        >>> murta2014a.pp = "71--84"
+        >>> digest == work_digest(murta2014a)
+        False
+    """
+    attrs = sorted(
+        (key, repr(value), str(value))
+        for key, value in work.__dict__.items()
+    )
+    text = repr((type(work).__name__, attrs))
+    return hashlib.md5(text.encode("utf-8")).hexdigest()
+
+
+def load_bibtex_cache():
+    """Load the cache of BibTeX exports from the database folder
+
+    The cache is discarded if the database configuration or the snowballing
+    version changed
+    """
+    config_stamp = _config_stamp()
+    try:
+        with open(str(bibtex_cache_file()), "r", encoding="utf-8") as cache_file:
+            cache = json.load(cache_file)
+    except (IOError, ValueError):
+        cache = {}
+    if cache.get("<config>") != config_stamp:
+        cache = {"<config>": config_stamp}
+    return cache
+
+
+def save_bibtex_cache(cache, metakeys=None):
+    """Save the cache of BibTeX exports into the database folder
+
+    If `metakeys` is defined, it drops entries of other works (e.g., renamed
+    or deleted work). The file is replaced atomically.
+    Nothing is saved if the database folder is not writable
+    """
+    if metakeys is not None:
+        for key in [key for key in cache if key != "<config>" and key not in metakeys]:
+            del cache[key]
+    filename = str(bibtex_cache_file())
+    temp = "{}.{}.tmp".format(filename, os.getpid())
+    try:
+        try:
+            with open(temp, "w", encoding="utf-8") as cache_file:
+                json.dump(cache, cache_file)
+            os.replace(temp, filename)
+        finally:
+            if os.path.exists(temp):
+                os.remove(temp)
+    except (IOError, OSError):
+        pass
+
+
+def _config_stamp():
+    """Return the modification time of the database configuration and the
+    installed snowballing version"""
+    try:
+        mtime = (config.DATABASE_DIR / "__init__.py").stat().st_mtime
+    except OSError:
+        mtime = None
+    try:
+        from importlib.metadata import version
+        package = version("snowballing")
+    except ImportError:
+        package = None
+    return [mtime, package]
+
+
+def work_to_bibtex_cached(work, cache):
+    """Convert work to bibtex text, reusing previous exports from `cache`
+
+    The cache maps work metakeys to pairs of :meth:`~work_digest` and BibTeX.
+    Entries of modified work are replaced.
+    Use BIBTEX_CACHE for an in-memory cache that is discarded on
+    :meth:`~reload`
+
+    Doctest:
+
+    .. doctest::
+
+        >>> reload()
+        >>> murta2014a = work_by_varname("murta2014a")
+        >>> cache = {}
+        >>> work_to_bibtex_cached(murta2014a, cache) == work_to_bibtex(murta2014a)
+        True
+        >>> cache['murta2014a'][0] == work_digest(murta2014a)
+        True
+    """
+    key = oget(work, "metakey")
+    if key is None:
+        return work_to_bibtex(work)
+    digest = work_digest(work)
+    entry = cache.get(key)
+    if entry and entry[0] == digest:
+        return entry[1]
+    result = work_to_bibtex(work)
+    cache[key] = [digest, result]
+    return result
+
+
 def match_bibtex_to_work(bibtex_str):
     """Find works by bibtex entries
 
@@ -847,15 +1071,27 @@ def match_bibtex_to_work(bibtex_str):
 
 
 def find(text):
-    """Find work by text in any of its attributes"""
-    words = text.split()
+    """Find work by text in any of its attributes
+
+    Doctest:
+
+    .. doctest::
+
+        >>> reload()
+        >>> [work @ metakey for work in find("provenance scripts")]
+        ['freire2008a', 'murta2014a']
+        >>> [work @ metakey for work in find("IPYTHON")]
+        ['pimentel2015a']
+        >>> list(find("nonexistent"))
+        []
+    """
+    words = text.lower().split()
     for work in load_work():
-        match = True
-        for word in words:
-            if not any(word.lower() in str(getattr(work, attr)).lower() for attr in dir(work) if not attr.startswith("_")):
-                match = False
-                break
-        if match:
+        attrs = [attr for attr in dir(work) if not attr.startswith("_")]
+        if all(
+            any(word in str(getattr(work, attr)).lower() for attr in attrs)
+            for word in words
+        ):
             yield work
 
 
@@ -4,7 +4,7 @@ from copy import copy, deepcopy
 from itertools import zip_longest
 
 from .collection_helpers import callable_get, setitem, consume
-from .utils import match_any
+from .utils import compile_any
 
 
 class ConvertDict(object):
@@ -22,7 +22,7 @@ class ConvertDict(object):
     def attrs(self, original):
         return original.keys()
 
-    def iterate_remaining(self, original, current):
+    def iterate_remaining(self, original, current, attrs=None):
         return current.items()
 
     def indicate_usage(self, current, key):
@@ -35,9 +35,10 @@ class ConvertDict(object):
         if isinstance(command, str):
             return command
         if callable(command):
-            if command.__code__.co_argcount == 1:
+            argcount = command.__code__.co_argcount
+            if argcount == 1:
                 return command(original)
-            if command.__code__.co_argcount == 2:
+            if argcount == 2:
                 return command(original, new)
             return command(original, new, current)
 
@@ -58,25 +59,33 @@ class ConvertDict(object):
                     new[new_key] = self.get(original, key)
 
     def run(self, original, article=None, new=None, skip_result=False):
+        rules = self.rules
         cp = self.new_current(original)
         new = new or {}
-        if "<before>" in self.rules:
-            self.apply(new, original, cp, self.rules["<before>"])
-        for key in self.attrs(original):
-            if key in self.rules:
-                self.apply(new, original, cp, self.rules[key], key=key)
+        if "<before>" in rules:
+            self.apply(new, original, cp, rules["<before>"])
+        attrs = list(self.attrs(original))
+        for key in attrs:
+            commands = rules.get(key)
+            if commands is not None:
+                self.apply(new, original, cp, commands, key=key)
                 self.indicate_usage(cp, key)
-        if "<middle>" in self.rules:
-            self.apply(new, original, cp, self.rules["<middle>"])
-        for key, value in self.iterate_remaining(original, cp):
+        if "<middle>" in rules:
+            self.apply(new, original, cp, rules["<middle>"])
+        if self.iterate_remaining.__code__.co_argcount > 3:
+            remaining = self.iterate_remaining(original, cp, attrs=attrs)
+        else:
+            # Overrides without attrs
+            remaining = self.iterate_remaining(original, cp)
+        for key, value in remaining:
             setitem(new, key, value)
 
-        if article is not None and "<article>" in self.rules:
-            self.apply(new, article, cp, self.rules["<article>"])
-        if "<after>" in self.rules:
-            self.apply(new, original, cp, self.rules["<after>"])
-        if "<result>" in self.rules and not skip_result:
-            return self.process_element(self.rules["<result>"], new, original, cp)
+        if article is not None and "<article>" in rules:
+            self.apply(new, article, cp, rules["<article>"])
+        if "<after>" in rules:
+            self.apply(new, original, cp, rules["<after>"])
+        if "<result>" in rules and not skip_result:
+            return self.process_element(rules["<result>"], new, original, cp)
         return new
 
 
@@ -88,14 +97,19 @@ class ConvertWork(ConvertDict):
         return getattr(original, key)
 
     def attrs(self, original):
-        use = callable_get(self.rules, "<use>", dir(original))
-        ignore = callable_get(self.rules, "<ignore>", [])
+        if "<use>" in self.rules:
+            use = callable_get(self.rules, "<use>")
+        else:
+            use = dir(original)
+        ignore = compile_any(callable_get(self.rules, "<ignore>", []))
         for key in reversed(use):
-            if hasattr(original, key) and not match_any(key, ignore):
+            if hasattr(original, key) and not ignore.match(key):
                 yield key
 
-    def iterate_remaining(self, original, current):
-        for key in self.attrs(original):
+    def iterate_remaining(self, original, current, attrs=None):
+        if attrs is None:
+            attrs = self.attrs(original)
+        for key in attrs:
             if key not in current:
                 yield key, str(getattr(original, key))
 
@@ -6,6 +6,7 @@ import difflib
 import sys
 
 from collections import namedtuple
+from functools import lru_cache
 from textwrap import TextWrapper
 from math import asinh, asin, cos
 from math import atan2, sin
@@ -14,9 +15,10 @@ from math import atan2, sin
 import bibtexparser
 from bibtexparser.bparser import BibTexParser
 from bibtexparser.customization import convert_to_unicode
-from IPython.display import display
 
 
+LITERAL_NAME = re.compile(r"\w+")
+
 
 def parse_bibtex(bib):
     """Parse BibTex and return list of entries"""
@@ -370,6 +372,109 @@ def compare_str(first, second):
     return difflib.SequenceMatcher(None, first, second).ratio()
 
 
+def compare_str_at_least(first, second, lower):
+    """Compare strings and return matching ratio, or 0 if the ratio is
+    certainly below lower
+
+    It checks cheaper upper bounds of :meth:`~compare_str` before computing
+    the ratio
+
+    Doctest:
+
+    .. doctest::
+
+        >>> compare_str_at_least('abcd', 'abed', 0.5)
+        0.75
+        >>> compare_str_at_least('abcd', 'a', 0.5)
+        0
+    """
+    matcher = difflib.SequenceMatcher(None, first, second)
+    if matcher.real_quick_ratio() < lower or matcher.quick_ratio() < lower:
+        return 0
+    return matcher.ratio()
+
+
+def similar_str(first, second, required):
+    """Check if the matching ratio of strings is greater than required
+
+    It checks cheaper upper bounds of :meth:`~compare_str` before computing
+    the ratio, to discard different strings early
+
+    Doctest:
+
+    .. doctest::
+
+        >>> similar_str('abcd', 'abed', 0.7)
+        True
+        >>> similar_str('abcd', 'abed', 0.8)
+        False
+        >>> similar_str('abcd', 'a', 0.5)
+        False
+    """
+    matcher = difflib.SequenceMatcher(None, first, second)
+    return (
+        matcher.real_quick_ratio() > required
+        and matcher.quick_ratio() > required
+        and matcher.ratio() > required
+    )
+
+
+class AnyPattern(object):
+    """Match strings against a set of literal names and a single compiled
+    alternation of the remaining regexes. See :meth:`~compile_any`"""
+
+    __slots__ = ("literals", "pattern")
+
+    def __init__(self, regexes):
+        self.literals = {
+            regex for regex in regexes if LITERAL_NAME.fullmatch(regex)
+        }
+        others = [regex for regex in regexes if regex not in self.literals]
+        self.pattern = None
+        if others:
+            self.pattern = re.compile("(?:{})$".format(
+                "|".join("(?:{})".format(regex) for regex in others)
+            ))
+
+    def match(self, string):
+        """Check if string matches any literal or regex"""
+        if string in self.literals:
+            return True
+        return self.pattern is not None and bool(self.pattern.match(string))
+
+
+def compile_any(regexes):
+    """Compile a list of regexes into a single pattern that matches any of them
+    until the end of the string
+
+    Literal names are checked with a set lookup before matching the regexes.
+    Compiled patterns are cached by the list of regexes
+
+    Doctest:
+
+    .. doctest::
+
+        >>> pattern = compile_any(["b", "c", "a", "_.*"])
+        >>> sorted(pattern.literals)
+        ['a', 'b', 'c']
+        >>> pattern.match("_a")
+        True
+        >>> pattern.match("a")
+        True
+        >>> pattern.match("ab")
+        False
+        >>> compile_any(["a"]).match("b")
+        False
+    """
+    return _compile_any(tuple(regexes))
+
+
+@lru_cache(maxsize=128)
+def _compile_any(regexes):
+    """Compile tuple of regexes. See :meth:`~compile_any`"""
+    return AnyPattern(regexes)
+
+
 def match_any(string, regexes):
     """Check if string matches any regex in list
 
@@ -385,16 +490,15 @@ def match_any(string, regexes):
         False
         >>> match_any("_a", ["b", "c", "a", "_.*"])
         True
+        >>> match_any("a", [])
+        False
     """
-    if len(regexes) >= 100:
-        return any(re.match(regex + "$", string) for regex in regexes)
-    else:
-        combined = "({})".format(")|(".join(regex + "$" for regex in regexes))
-        return bool(re.match(combined, string))
+    return compile_any(regexes).match(string)
     
 
 def display_list(elements):
     """Display list of elements using IPython display"""
+    from IPython.display import display
     for disp in elements or []:
         display(disp)
 
@@ -14,8 +14,8 @@ from .collection_helpers import oget, dset
 from .utils import parse_bibtex
 from .snowballing import form_definition, WebNavigator
 from .operations import bibtex_to_info, load_work_map_all_years
-from .operations import work_to_bibtex, reload, find, work_by_varname
-from .operations import should_add_info
+from .operations import work_to_bibtex_cached, reload, find, work_by_varname
+from .operations import should_add_info, BIBTEX_CACHE
 from .operations import invoke_editor, metakey
 from .dbmanager import insert, set_attribute
 from . import config
@@ -97,7 +97,7 @@ def unified_find(info, scholar, latex, db_latex, citation_var, citation_file, ba
 
         work = find_work_by_scholar(scholar)
         if work is not None and info is None:
-            info = latex_to_info(work_to_bibtex(work))
+            info = latex_to_info(work_to_bibtex_cached(work, BIBTEX_CACHE))
         
         pyref = None
         if info is not None:
@@ -128,7 +128,7 @@ def unified_find(info, scholar, latex, db_latex, citation_var, citation_file, ba
         
         if work:
             if not db_latex:
-                db_latex = work_to_bibtex(work)
+                db_latex = work_to_bibtex_cached(work, BIBTEX_CACHE)
             if not latex:
                 latex = db_latex
             if pyref is None:
@@ -219,7 +219,7 @@ def do_click(result, work, should_add):
 @app.route("/simpleclick")
 def do_simpleclick():
     pyref = request.args.get('pyref')
-    reload()
+    reload(lazy=True)
     work = work_by_varname(pyref)
     result = "{} not found".format(pyref)
     if work:
@@ -234,13 +234,13 @@ def do_simpleclick():
 @app.route("/simplefind", methods=["GET", "POST"])
 def do_find():
     pyref = request.args.get('pyref').strip()
-    reload()
+    reload(lazy=True)
     work = work_by_varname(pyref)
     result = {
         "found": None
     }
     if work:
-        info = latex_to_info(work_to_bibtex(work))
+        info = latex_to_info(work_to_bibtex_cached(work, BIBTEX_CACHE))
         scholar = getattr(work, 'scholar', None)
         if isinstance(scholar, list) and scholar:
             scholar = scholar[0]